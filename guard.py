@@ -27,252 +27,737 @@
 	be scattered `if` statements into a clear, reusable validation layer.
 """
 
+from __future__ import annotations
+
 import os
-from typing import Any
+import stat
+import sys
+import time
 from numbers import Number
-from collections.abc import Iterable
+
+# Annotations are not evaluated on import, so the comparatively slow `typing` import is
+# only needed by type checkers. `Any` still gets a cheap runtime binding so that
+# `typing.get_type_hints()` can resolve the annotations.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Any
+else:
+	Any = object
+
+
+# Guards are enabled unless Python runs with `-O` or the `PYTHON_GUARDS`
+# environment variable is set to "0". When disabled, every guard is rebound at
+# import time to an identity function that returns its argument unchecked.
+GUARDS_ENABLED = __debug__ and os.environ.get("PYTHON_GUARDS", "1") != "0"
+
+# Types that are iterable but rejected by `against_not_iterable`.
+_STRBYTES = (str, bytes)
+
+
+# Error message templates, filled in with `%` by the cold-path raisers below.
+_MSG_NONE = "Argument '%s' must not be None."
+_MSG_NEGATIVE = "Argument '%s' must be positive"
+_MSG_EMPTY_STRING = "Argument '%s' must not be ''"
+_MSG_ZERO = "Argument '%s' must not be zero."
+_MSG_NONPOSITIVE = "Argument '%s' must be greater than zero."
+_MSG_EMPTY_COLLECTION = "Argument '%s' must not be empty."
+_MSG_WRONG_TYPE = "Argument '%s' must be of type %s. Got %s."
+_MSG_INVALID_PATH = "Argument '%s' must be a valid %s path (str, bytes, or os.PathLike)."
+_MSG_FILE_NOT_FOUND = "File not found: '%s'"
+_MSG_DIRECTORY_NOT_FOUND = "Directory not found: '%s'"
+_MSG_IS_A_DIRECTORY = "Expected a file but found a directory: '%s'"
+_MSG_NOT_A_DIRECTORY = "Expected a directory but found a file: '%s'"
+_MSG_NOT_ITERABLE = "Argument '%s' must be an iterable (not str/bytes)."
+_MSG_NONE_ARRAY = "Argument '%s' must not contain None, NaN or NaT values."
+_MSG_NEGATIVE_ARRAY = "Argument '%s' must not contain negative values."
+_MSG_ZERO_ARRAY = "Argument '%s' must not contain zeros."
+
+
+# Cold-path raisers. Keeping the message formatting out of the guards themselves
+# leaves the success path of each guard as a single test and return.
+
+def _raise_none(argument_name: str):
+	raise ValueError(_MSG_NONE % (argument_name,))
+
+def _raise_negative(argument_name: str):
+	raise ValueError(_MSG_NEGATIVE % (argument_name,))
+
+def _raise_empty_string(argument_name: str):
+	raise ValueError(_MSG_EMPTY_STRING % (argument_name,))
+
+def _raise_zero(argument_name: str):
+	raise ValueError(_MSG_ZERO % (argument_name,))
+
+def _raise_nonpositive(argument_name: str):
+	raise ValueError(_MSG_NONPOSITIVE % (argument_name,))
+
+def _raise_empty_collection(argument_name: str):
+	raise ValueError(_MSG_EMPTY_COLLECTION % (argument_name,))
+
+def _raise_wrong_type(argument: Any, expected_type: type, argument_name: str):
+	raise TypeError(_MSG_WRONG_TYPE % (argument_name, expected_type.__name__, type(argument).__name__))
+
+def _raise_invalid_path(path: Any, argument_name: str, kind: str):
+	# Called from the `except TypeError` handler in `_check_pathlike`; `from None`
+	# keeps the internal `os.fspath` error out of the traceback.
+	if path is None:
+		raise ValueError(_MSG_NONE % (argument_name,)) from None
+	raise TypeError(_MSG_INVALID_PATH % (argument_name, kind)) from None
+
+def _raise_file_not_found(path: Any):
+	raise FileNotFoundError(_MSG_FILE_NOT_FOUND % (path,))
+
+def _raise_directory_not_found(path: Any):
+	raise FileNotFoundError(_MSG_DIRECTORY_NOT_FOUND % (path,))
+
+def _raise_is_a_directory(path: Any):
+	raise IsADirectoryError(_MSG_IS_A_DIRECTORY % (path,))
+
+def _raise_not_a_directory(path: Any):
+	raise NotADirectoryError(_MSG_NOT_A_DIRECTORY % (path,))
+
+def _raise_not_iterable(argument_name: str):
+	raise TypeError(_MSG_NOT_ITERABLE % (argument_name,))
+
+def _raise_none_array(argument_name: str):
+	raise ValueError(_MSG_NONE_ARRAY % (argument_name,))
+
+def _raise_negative_array(argument_name: str):
+	raise ValueError(_MSG_NEGATIVE_ARRAY % (argument_name,))
+
+def _raise_zero_array(argument_name: str):
+	raise ValueError(_MSG_ZERO_ARRAY % (argument_name,))
+
+
+# Filesystem lookups are memoized for absolute paths that were found to exist, as the
+# same handful of paths tends to be validated over and over. Each entry maps a path,
+# keyed exactly as given without normalization, to the time it was looked up and its
+# `st_mode`, and is trusted for `_PATH_CACHE_TTL` seconds. Once the cache is full, the
+# entry looked up longest ago is evicted. Misses and relative paths are never cached.
+# Callers that need removals to be seen sooner call `invalidate_path_cache()`.
+_PATH_CACHE_TTL = 1.0
+_PATH_CACHE_SIZE = 4096
+_PATH_CACHE = {}
+
+def _stat_mode(path):
+	now = time.monotonic()
+	entry = _PATH_CACHE.get(path)
+	if entry is not None:
+		if now - entry[0] < _PATH_CACHE_TTL:
+			return entry[1]
+		# Re-inserted below so that the refreshed entry moves to the young end.
+		_PATH_CACHE.pop(path, None)
+	try:
+		mode = os.stat(path).st_mode
+	except (OSError, ValueError):
+		return None
+	if os.path.isabs(path):
+		if len(_PATH_CACHE) >= _PATH_CACHE_SIZE:
+			try:
+				del _PATH_CACHE[next(iter(_PATH_CACHE))]
+			except (KeyError, RuntimeError, StopIteration):
+				# Another thread changed the cache between `iter` and `next`. Skipping
+				# one eviction only lets the cache run briefly over its size.
+				pass
+		_PATH_CACHE[path] = (now, mode)
+	return mode
+
+def _check_pathlike(path: Any, argument_name: str, kind: str):
+	# Shared front half of the path guards: rejects None and non-path arguments and
+	# returns the cached `st_mode` of the path, or None if it does not exist.
+	try:
+		return _stat_mode(os.fspath(path))
+	except TypeError:
+		_raise_invalid_path(path, argument_name, kind)
+
+def invalidate_path_cache(path: Any = None):
+	"""
+	Drops cached results of the file and directory guards.
+
+	`against_file_not_found` and `against_directory_not_found` reuse a successful
+	`os.stat` of an absolute path for up to one second, so a path that is removed or
+	replaced may keep passing for that long. Call this after moving or deleting files
+	so that subsequent checks see the current state of the file system straight away.
+	Paths that did not exist are never cached and need no invalidation.
+
+	Args:
+		path (Any, optional): The `str`, `bytes` or `os.PathLike` path to forget.
+			Absolute paths are matched exactly as they were passed to the guards;
+			relative paths are resolved against the current working directory.
+			If omitted, the whole cache is cleared.
+	"""
+	if path is None:
+		_PATH_CACHE.clear()
+		return
+	key = os.fspath(path)
+	if not os.path.isabs(key):
+		key = os.path.abspath(key)
+	_PATH_CACHE.pop(key, None)
+
+
+def against_none(argument: Any, argument_name: str = "value"):
+	"""
+	Raises an exception if the given argument is None.
+
+	This guard ensures that a required argument has been provided and is not `None`.
+	It is useful for enforcing non-null preconditions before performing operations
+	that assume the presence of a valid object or value.
+
+	Args:
+		argument (Any): The value to check.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		ValueError: If `argument` is None.
+
+	Returns:
+		Any: The original argument, unchanged, if validation passes.
+	"""
+
+	return argument if argument is not None else _raise_none(argument_name)
+
+def against_negative(argument: Number, argument_name: str = "value"):
+	"""
+	Raises an exception if the given numeric argument is negative.
+
+	This guard ensures that a numeric value is zero or positive, preventing the use
+	of invalid negative numbers in contexts such as counts, sizes, or other quantities
+	that must not be less than zero.
+
+	Args:
+		argument (Number): The numeric value to check.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		ValueError: If `argument` is less than zero.
+
+	Returns:
+		Number: The original argument, unchanged, if validation passes.
+	"""
+
+	if argument < 0:
+		_raise_negative(argument_name)
+	return argument
+
+def against_empty_string(argument: str, argument_name: str = "value"):
+	"""
+	Raises an exception if the given string argument is empty.
+
+	This guard ensures that a string value contains at least one character.
+	It is useful for validating identifiers, names, or any required text input
+	that must not be an empty string.
+
+	Args:
+		argument (str): The string value to check.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		ValueError: If `argument` is an empty string.
+
+	Returns:
+		str: The original argument, unchanged, if validation passes.
+	"""
+	if argument == "":
+		_raise_empty_string(argument_name)
+	return argument
+
+def against_zero(argument: Number, argument_name: str = "value"):
+	"""
+	Raises an exception if the given numeric argument is zero.
+
+	This guard is useful in contexts where zero is not a valid value,
+	such as when used as a divisor, a scaling factor, or an identifier
+	that must be nonzero.
+
+	Args:
+		argument (Number): The numeric value to check.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		ValueError: If `argument` equals zero.
+
+	Returns:
+		Number: The original argument, unchanged, if validation passes.
+	"""
+	if argument == 0:
+		_raise_zero(argument_name)
+	return argument
+
+def against_nonpositive(argument: Number, argument_name: str = "value"):
+	"""
+	Raises an exception if the given numeric argument is zero or negative.
+
+	This guard combines `against_negative` and `against_zero` into a single comparison.
+	It is useful for values that must be strictly positive, such as sizes, timeouts,
+	or divisors that are also quantities.
+
+	Args:
+		argument (Number): The numeric value to check.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		ValueError: If `argument` is less than or equal to zero.
+
+	Returns:
+		Number: The original argument, unchanged, if validation passes.
+	"""
+	if argument <= 0:
+		_raise_nonpositive(argument_name)
+	return argument
+
+def against_empty_collection(argument, argument_name: str = "value"):
+	"""
+	Raises an exception if the given collection is empty.
+
+	This guard ensures that an iterable or collection (such as a list, tuple,
+	set, or dictionary) contains at least one element. It is useful for validating
+	inputs where an empty container would make further processing invalid or meaningless.
+
+	The check uses the argument's truth value, so falsy non-collections such as `0`,
+	`False` or `None` are rejected as empty too.
+
+	Args:
+		argument (Any): The collection or iterable to check.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		ValueError: If `argument` is empty or evaluates to False.
+
+	Returns:
+		Any: The original argument, unchanged, if validation passes.
+	"""
+	if not argument:
+		_raise_empty_collection(argument_name)
+	return argument
+
+def against_wrong_type(argument: Any, expected_type: type, argument_name: str = "value"):
+	"""
+	Raises an exception if the given argument is not of the expected type.
+
+	This guard validates that an argument matches the required type before it is used.
+	It helps catch programming errors early, especially in dynamically typed code where
+	type assumptions might otherwise go unchecked.
+
+	Args:
+		argument (Any): The value to check.
+		expected_type (type): The expected type or class the argument should be an instance of.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		TypeError: If `argument` is not an instance of `expected_type`.
+
+	Returns:
+		Any: The original argument, unchanged, if validation passes.
+	"""
+	if not isinstance(argument, expected_type):
+		_raise_wrong_type(argument, expected_type, argument_name)
+	return argument
+
+def against_file_not_found(path: Any, argument_name: str = "file_path"):
+	"""
+	Raises an exception if the specified file path does not exist.
+
+	This guard validates that the given path points to an existing file.
+	It helps ensure that file-dependent operations do not fail unexpectedly
+	due to missing or invalid file paths.
+
+	Results are cached per path for up to one second; see `invalidate_path_cache()`.
+
+	Args:
+		path (Any): The file path to check. Must be a valid `str`, `bytes`,
+			or `os.PathLike` object.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "file_path".
+
+	Raises:
+		ValueError: If `path` is None.
+		TypeError: If `path` is not a valid path-like type.
+		FileNotFoundError: If the file does not exist at the given path.
+		IsADirectoryError: If the path exists but is a directory.
+
+	Returns:
+		Any: The original path, unchanged, if validation passes.
+	"""
+	mode = _check_pathlike(path, argument_name, "file")
+	if mode is None:
+		_raise_file_not_found(path)
+	if stat.S_ISDIR(mode):
+		_raise_is_a_directory(path)
+	return path
+
+def against_directory_not_found(path: Any, argument_name: str = "directory"):
+	"""
+	Raises an exception if the specified directory path does not exist.
+
+	This guard ensures that a given path points to a valid, existing directory.
+	It is useful for validating configuration paths, output locations, or any
+	file system directories required by the program.
+
+	Results are cached per path for up to one second; see `invalidate_path_cache()`.
+
+	Args:
+		path (Any): The directory path to check. Must be a valid `str`, `bytes`,
+			or `os.PathLike` object.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "directory".
+
+	Raises:
+		ValueError: If `path` is None.
+		TypeError: If `path` is not a valid path-like type.
+		FileNotFoundError: If the specified directory does not exist.
+		NotADirectoryError: If the path exists but is not a directory.
+
+	Returns:
+		Any: The original path, unchanged, if validation passes.
+	"""
+	mode = _check_pathlike(path, argument_name, "directory")
+	if mode is None:
+		_raise_directory_not_found(path)
+	if not stat.S_ISDIR(mode):
+		_raise_not_a_directory(path)
+	return path
+
+def against_not_iterable(argument: Any, argument_name: str = "value"):
+	"""
+	Raises an exception if the given argument is not an iterable.
+
+	This guard ensures that the provided argument supports iteration, such as lists,
+	tuples, sets, or generators, while explicitly excluding `str` and `bytes`, which
+	are technically iterable but often represent single values rather than collections.
+
+	Args:
+		argument (Any): The value to check for iterability.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		TypeError: If `argument` is not iterable or is a `str`/`bytes` instance.
+
+	Returns:
+		Any: The original argument, unchanged, if validation passes.
+	"""
+	# Look `__iter__` up in the class dictionaries only, as iteration does. A plain
+	# attribute lookup on the type would also find `__iter__` on its metaclass.
+	iter_method = next((klass.__dict__["__iter__"] for klass in type(argument).__mro__ if "__iter__" in klass.__dict__), None)
+	if iter_method is None or isinstance(argument, _STRBYTES):
+		_raise_not_iterable(argument_name)
+	return argument
+
+def batch(
+	argument: Any,
+	argument_name: str = "value",
+	*,
+	not_none: bool = False,
+	expected_type: type = None,
+	not_negative: bool = False,
+	not_zero: bool = False,
+	not_empty: bool = False,
+):
+	"""
+	Runs several guards against one argument in a single call.
+
+	Call sites that chain guards, such as `against_none(x)` followed by
+	`against_negative(x)` and `against_zero(x)`, pay for one Python call per check.
+	`batch` performs the requested checks inline instead, in the order listed below,
+	and raises the same exceptions as the individual guards.
+
+	Example:
+		>>> count = batch(user_count, "user_count", not_none=True, not_negative=True)
+
+	Args:
+		argument (Any): The value to check.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+		not_none (bool, optional): Apply `against_none`.
+		expected_type (type, optional): Apply `against_wrong_type` with this type.
+		not_negative (bool, optional): Apply `against_negative`.
+		not_zero (bool, optional): Apply `against_zero`.
+		not_empty (bool, optional): Apply `against_empty_collection`.
+
+	Raises:
+		ValueError: If `argument` is None, negative, zero or empty, as requested.
+		TypeError: If `argument` is not an instance of `expected_type`.
+
+	Returns:
+		Any: The original argument, unchanged, if validation passes.
+	"""
+	if not_none and argument is None:
+		_raise_none(argument_name)
+	if expected_type is not None and not isinstance(argument, expected_type):
+		_raise_wrong_type(argument, expected_type, argument_name)
+	if not_negative and argument < 0:
+		_raise_negative(argument_name)
+	if not_zero and argument == 0:
+		_raise_zero(argument_name)
+	if not_empty and not argument:
+		_raise_empty_collection(argument_name)
+	return argument
+
+
+# Specialized `against_none` guards, one per argument name, shared between callers
+# for as long as any of them holds a reference. Created on first use of `none_for`.
+_NONE_GUARDS = None
+
+def none_for(argument_name: str = "value"):
+	"""
+	Returns an `against_none` guard with the argument name bound in advance.
+
+	The returned function takes only the argument to check, which makes it a good fit
+	for loops that validate the same field over and over. Calling `none_for` again with
+	the same name returns the same function while it is still referenced elsewhere.
+
+	Example:
+		>>> check_user_id = none_for("user_id")
+		>>> for row in rows:
+		...     check_user_id(row.user_id)
+
+	Args:
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Returns:
+		Callable[[Any], Any]: A guard that raises `ValueError` if its argument is None
+			and returns the argument unchanged otherwise.
+	"""
+	global _NONE_GUARDS
+	if not GUARDS_ENABLED:
+		return _identity
+	if _NONE_GUARDS is None:
+		import weakref
+		_NONE_GUARDS = weakref.WeakValueDictionary()
+	if type(argument_name) is str:
+		argument_name = sys.intern(argument_name)
+	guard = _NONE_GUARDS.get(argument_name)
+	if guard is None:
+		import functools
+
+		_raise = functools.partial(_raise_none, argument_name)
+
+		def guard(argument: Any):
+			return argument if argument is not None else _raise()
+
+		_NONE_GUARDS[argument_name] = guard
+	return guard
+
+
+# Array guards validate whole NumPy arrays in one call. NumPy, and Numba when it
+# is installed, are imported on first use so that the module itself stays free of
+# dependencies for callers that never validate arrays.
+
+# Dtypes the Numba kernel is compiled for. Anything else, including byte-swapped
+# arrays, float16 and longdouble, is checked with a NumPy comparison instead.
+_KERNEL_DTYPES = frozenset({"int8", "int16", "int32", "int64", "float32", "float64"})
+
+# Source of the Numba kernel. Numba needs real Python bytecode, which a Cython-compiled
+# guard module does not have, so the kernel is compiled from this string instead.
+_ANY_NEGATIVE_SOURCE = """
+def _any_negative_kernel(values):
+	for value in values:
+		if value < 0:
+			return True
+	return False
+"""
+
+_any_negative_kernel = None
+
+def _any_negative(values) -> bool:
+	global _any_negative_kernel
+	if _any_negative_kernel is None:
+		try:
+			from numba import njit
+		except ImportError:
+			_any_negative_kernel = lambda values: bool((values < 0).any())
+		else:
+			namespace = {"__name__": __name__}
+			exec(compile(_ANY_NEGATIVE_SOURCE, __file__, "exec"), namespace)
+			_any_negative_kernel = njit(cache=True)(namespace["_any_negative_kernel"])
+	return _any_negative_kernel(values)
+
+def against_none_array(argument: Any, argument_name: str = "value"):
+	"""
+	Raises an exception if the given array contains missing values.
+
+	This guard checks every element of a NumPy array (or anything `numpy.asarray`
+	accepts). Missing values are NaN for floating point and complex arrays, NaT for
+	datetime and timedelta arrays, and `None` or any value that is not equal to itself
+	(such as a NumPy or `Decimal` NaN) for object arrays. Numeric and datetime arrays
+	are checked in a single vectorized pass; object arrays are scanned element by
+	element in Python. Integer and boolean arrays cannot hold missing values and
+	always pass.
+
+	Args:
+		argument (Any): The array to check. Requires NumPy.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		ValueError: If `argument` contains a None, NaN or NaT value.
+
+	Returns:
+		Any: The original argument, unchanged, if validation passes.
+	"""
+	import numpy as np
+
+	array = np.asarray(argument)
+	kind = array.dtype.kind
+	if kind in "fc":
+		missing = np.isnan(array).any()
+	elif kind in "mM":
+		missing = np.isnat(array).any()
+	elif kind == "O":
+		missing = any(value is None or value != value for value in array.flat)
+	else:
+		missing = False
+	if missing:
+		_raise_none_array(argument_name)
+	return argument
+
+def against_negative_array(argument: Any, argument_name: str = "value"):
+	"""
+	Raises an exception if the given numeric array contains a negative value.
+
+	This is the bulk counterpart of `against_negative`, intended for arrays far too
+	large to validate element by element from Python. When Numba is installed, native
+	byte order int8 to int64, float32 and float64 arrays are scanned by a compiled loop
+	that stops at the first negative value; every other array is checked with a
+	vectorized NumPy comparison. Unsigned arrays are accepted without being scanned.
+
+	Args:
+		argument (Any): The array to check. Requires NumPy.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		ValueError: If any element of `argument` is less than zero.
+
+	Returns:
+		Any: The original argument, unchanged, if validation passes.
+	"""
+	import numpy as np
+
+	array = np.asarray(argument)
+	dtype = array.dtype
+	if dtype.isnative and dtype.name in _KERNEL_DTYPES:
+		negative = _any_negative(array.ravel())
+	elif dtype.kind in "ub":
+		negative = False
+	else:
+		negative = (array < 0).any()
+	if negative:
+		_raise_negative_array(argument_name)
+	return argument
+
+def against_zero_array(argument: Any, argument_name: str = "value"):
+	"""
+	Raises an exception if the given numeric array contains a zero.
+
+	This is the bulk counterpart of `against_zero`, useful for validating arrays that
+	are about to be used as divisors or scaling factors.
+
+	Args:
+		argument (Any): The array to check. Requires NumPy.
+		argument_name (str, optional): The name of the argument being validated.
+			Used in the error message for clarity. Defaults to "value".
+
+	Raises:
+		ValueError: If any element of `argument` equals zero.
+
+	Returns:
+		Any: The original argument, unchanged, if validation passes.
+	"""
+	import numpy as np
+
+	if (np.asarray(argument) == 0).any():
+		_raise_zero_array(argument_name)
+	return argument
 
 
 class Guard():
 	"""
-		A utility class providing static guard methods for validating function arguments.
+		A namespace exposing the module-level guard functions as static methods.
 
 		The `Guard` class is designed to make argument validation concise and expressive,
-		preventing invalid or unexpected values early in code execution. Each method raises
+		preventing invalid or unexpected values early in code execution. Each guard raises
 		an appropriate Python exception (such as `ValueError`, `TypeError`, or
 		`FileNotFoundError`) when validation fails, and returns the validated argument
 		otherwise. This allows guards to be used inline in assignments or function calls.
 
+		The guards are plain module-level functions; `Guard` only groups them. Importing
+		the functions directly is recommended in hot code, as it skips the class attribute
+		lookup on every call. `Guard` cannot be instantiated.
+
 		Example:
+			>>> from guard import against_none, against_negative
+			>>> value = against_none(input_value, "input_value")
+			>>> count = against_negative(user_count, "user_count")
+
 			>>> from guard import Guard
 			>>> value = Guard.against_none(input_value, "input_value")
-			>>> count = Guard.against_negative(user_count, "user_count")
 	"""
 
-	@staticmethod
-	def against_none(argument: Any, argument_name: str = "value"):
-		"""
-		Raises an exception if the given argument is None.
-
-		This guard ensures that a required argument has been provided and is not `None`.
-		It is useful for enforcing non-null preconditions before performing operations
-		that assume the presence of a valid object or value.
-
-		Args:
-			argument (Any): The value to check.
-			argument_name (str, optional): The name of the argument being validated.
-				Used in the error message for clarity. Defaults to "value".
-
-		Raises:
-			ValueError: If `argument` is None.
-
-		Returns:
-			Any: The original argument, unchanged, if validation passes.
-		"""
-
-		if argument is None:
-			raise ValueError(f"Argument '{argument_name}' must not be None.")
-		return argument
-	
-	@staticmethod
-	def against_negative(argument: Number, argument_name: str = "value"):
-		"""
-		Raises an exception if the given numeric argument is negative.
-
-		This guard ensures that a numeric value is zero or positive, preventing the use
-		of invalid negative numbers in contexts such as counts, sizes, or other quantities
-		that must not be less than zero.
-
-		Args:
-			argument (Number): The numeric value to check.
-			argument_name (str, optional): The name of the argument being validated.
-				Used in the error message for clarity. Defaults to "value".
-
-		Raises:
-			ValueError: If `argument` is less than zero.
-
-		Returns:
-			Number: The original argument, unchanged, if validation passes.
-		"""
-
-		if argument < 0:
-			raise ValueError(f"Argument '{argument_name}' must be positive")
-		return argument
-	
-	@staticmethod
-	def against_empty_string(argument: str, argument_name: str = "value"):
-		"""
-		Raises an exception if the given string argument is empty.
-
-		This guard ensures that a string value contains at least one character.
-		It is useful for validating identifiers, names, or any required text input
-		that must not be an empty string.
-
-		Args:
-			argument (str): The string value to check.
-			argument_name (str, optional): The name of the argument being validated.
-				Used in the error message for clarity. Defaults to "value".
-
-		Raises:
-			ValueError: If `argument` is an empty string.
-
-		Returns:
-			str: The original argument, unchanged, if validation passes.
-		"""
-		if argument == "":
-			raise ValueError (f"Argument '{argument_name}' must not be ''")
-		return argument
-	
-	@staticmethod
-	def against_zero(argument: Number, argument_name: str = "value"):
-		"""
-		Raises an exception if the given numeric argument is zero.
-
-		This guard is useful in contexts where zero is not a valid value,
-		such as when used as a divisor, a scaling factor, or an identifier
-		that must be nonzero.
-
-		Args:
-			argument (Number): The numeric value to check.
-			argument_name (str, optional): The name of the argument being validated.
-				Used in the error message for clarity. Defaults to "value".
-
-		Raises:
-			ValueError: If `argument` equals zero.
-
-		Returns:
-			Number: The original argument, unchanged, if validation passes.
-		"""
-		if argument == 0:
-			raise ValueError(f"Argument '{argument_name}' must not be zero.")
-		return argument
-
-	@staticmethod
-	def against_empty_collection(argument, argument_name: str = "value"):
-		"""
-		Raises an exception if the given collection is empty.
-
-		This guard ensures that an iterable or collection (such as a list, tuple,
-		set, or dictionary) contains at least one element. It is useful for validating
-		inputs where an empty container would make further processing invalid or meaningless.
-
-		Args:
-			argument (Any): The collection or iterable to check.
-			argument_name (str, optional): The name of the argument being validated.
-				Used in the error message for clarity. Defaults to "value".
-
-		Raises:
-			ValueError: If `argument` is empty or evaluates to False.
-
-		Returns:
-			Any: The original argument, unchanged, if validation passes.
-		"""
-		if not argument:
-			raise ValueError(f"Argument '{argument_name}' must not be empty.")
-		return argument
-	
-	@staticmethod
-	def against_wrong_type(argument: Any, expected_type: type, argument_name: str = "value"):
-		"""
-		Raises an exception if the given argument is not of the expected type.
-
-		This guard validates that an argument matches the required type before it is used.
-		It helps catch programming errors early, especially in dynamically typed code where
-		type assumptions might otherwise go unchecked.
-
-		Args:
-			argument (Any): The value to check.
-			expected_type (type): The expected type or class the argument should be an instance of.
-			argument_name (str, optional): The name of the argument being validated.
-				Used in the error message for clarity. Defaults to "value".
-
-		Raises:
-			TypeError: If `argument` is not an instance of `expected_type`.
-
-		Returns:
-			Any: The original argument, unchanged, if validation passes.
-		"""
-		if not isinstance(argument, expected_type):
-			raise TypeError(f"Argument '{argument_name}' must be of type {expected_type.__name__}. Got {type(argument).__name__}.")
-		return argument
-
-	@staticmethod
-	def against_file_not_found(path: Any, argument_name: str = "file_path"):
-		"""
-		Raises an exception if the specified file path does not exist.
-
-		This guard validates that the given path points to an existing file.
-		It helps ensure that file-dependent operations do not fail unexpectedly
-		due to missing or invalid file paths.
-
-		Args:
-			path (Any): The file path to check. Must be a valid `str`, `bytes`,
-				or `os.PathLike` object.
-			argument_name (str, optional): The name of the argument being validated.
-				Used in the error message for clarity. Defaults to "file_path".
-
-		Raises:
-			ValueError: If `path` is None.
-			TypeError: If `path` is not a valid path-like type.
-			FileNotFoundError: If the file does not exist at the given path.
-
-		Returns:
-			Any: The original path, unchanged, if validation passes.
-		"""
-		if path is None:
-			raise ValueError(f"Argument '{argument_name}' must not be None.")
-		if not isinstance(path, (str, bytes, os.PathLike)):
-			raise TypeError(f"Argument '{argument_name}' must be a valid file path (str, bytes, or os.PathLike).")
-		if not os.path.exists(path):
-			raise FileNotFoundError(f"File not found: '{path}'")
-		return path
-	
-	@staticmethod
-	def against_directory_not_found(path: Any, argument_name: str = "directory"):
-		"""
-		Raises an exception if the specified directory path does not exist.
-
-		This guard ensures that a given path points to a valid, existing directory.
-		It is useful for validating configuration paths, output locations, or any
-		file system directories required by the program.
-
-		Args:
-			path (Any): The directory path to check. Must be a valid `str`, `bytes`,
-				or `os.PathLike` object.
-			argument_name (str, optional): The name of the argument being validated.
-				Used in the error message for clarity. Defaults to "directory".
-
-		Raises:
-			FileNotFoundError: If the specified directory does not exist.
-
-		Returns:
-			Any: The original path, unchanged, if validation passes.
-		"""
-		if not os.path.isdir(path):
-			raise FileNotFoundError(f"Directory not found: '{path}'")
-		return path
-	
-	@staticmethod
-	def against_not_iterable(argument: Any, argument_name: str = "value"):
-		"""
-		Raises an exception if the given argument is not an iterable.
-
-		This guard ensures that the provided argument supports iteration, such as lists,
-		tuples, sets, or generators, while explicitly excluding `str` and `bytes`, which
-		are technically iterable but often represent single values rather than collections.
-
-		Args:
-			argument (Any): The value to check for iterability.
-			argument_name (str, optional): The name of the argument being validated.
-				Used in the error message for clarity. Defaults to "value".
-
-		Raises:
-			TypeError: If `argument` is not iterable or is a `str`/`bytes` instance.
-
-		Returns:
-			Any: The original argument, unchanged, if validation passes.
-		"""
-		if not isinstance(argument, Iterable) or isinstance(argument, (str, bytes)):
-			raise TypeError(f"Argument '{argument_name}' must be an iterable (not str/bytes).")
-		return argument
-
+	__slots__ = ()
+
+	def __new__(cls, *args, **kwargs):
+		raise TypeError("Guard is a namespace of static guards and cannot be instantiated.")
+
+	against_none = staticmethod(against_none)
+	against_negative = staticmethod(against_negative)
+	against_empty_string = staticmethod(against_empty_string)
+	against_zero = staticmethod(against_zero)
+	against_nonpositive = staticmethod(against_nonpositive)
+	against_empty_collection = staticmethod(against_empty_collection)
+	against_wrong_type = staticmethod(against_wrong_type)
+	against_file_not_found = staticmethod(against_file_not_found)
+	against_directory_not_found = staticmethod(against_directory_not_found)
+	against_not_iterable = staticmethod(against_not_iterable)
+	against_none_array = staticmethod(against_none_array)
+	against_negative_array = staticmethod(against_negative_array)
+	against_zero_array = staticmethod(against_zero_array)
+	invalidate_path_cache = staticmethod(invalidate_path_cache)
+	none_for = staticmethod(none_for)
+	batch = staticmethod(batch)
+
+
+_GUARD_NAMES = (
+	"against_none",
+	"against_negative",
+	"against_empty_string",
+	"against_zero",
+	"against_nonpositive",
+	"against_empty_collection",
+	"against_wrong_type",
+	"against_file_not_found",
+	"against_directory_not_found",
+	"against_not_iterable",
+	"batch",
+	"against_none_array",
+	"against_negative_array",
+	"against_zero_array",
+)
+
+
+# The path guards name their first parameter `path`, so they need their own identity
+# to keep accepting it as a keyword argument.
+_PATH_GUARD_NAMES = ("against_file_not_found", "against_directory_not_found")
+
+
+def _identity(argument: Any, *args, **kwargs):
+	return argument
+
+def _path_identity(path: Any, *args, **kwargs):
+	return path
+
+
+if not GUARDS_ENABLED:
+	for _name in _GUARD_NAMES:
+		_disabled = _path_identity if _name in _PATH_GUARD_NAMES else _identity
+		globals()[_name] = _disabled
+		setattr(Guard, _name, staticmethod(_disabled))
+	del _name, _disabled
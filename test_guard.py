@@ -0,0 +1,322 @@
+"""
+	Regression tests for the guards. Run with `python -m unittest`.
+
+	The array guard tests are skipped when NumPy is not installed; the dtype tests
+	exercise the Numba kernel when Numba is installed and the NumPy fallback otherwise.
+"""
+
+import enum
+import numbers
+import os
+import subprocess
+import sys
+import tempfile
+import typing
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+import guard
+from guard import Guard
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+
+class GuardTests(unittest.TestCase):
+
+	def test_guards_return_their_argument(self):
+		self.assertEqual(Guard.against_none(1), 1)
+		self.assertEqual(Guard.against_negative(0), 0)
+		self.assertEqual(Guard.against_zero(2), 2)
+		self.assertEqual(Guard.against_empty_string("a"), "a")
+		self.assertEqual(Guard.against_empty_collection([1]), [1])
+		self.assertIs(Guard.against_wrong_type(True, int), True)
+		self.assertEqual(Guard.against_not_iterable((1,)), (1,))
+
+	def test_guards_raise_with_argument_name(self):
+		with self.assertRaisesRegex(ValueError, "'x' must not be None"):
+			Guard.against_none(None, "x")
+		with self.assertRaisesRegex(ValueError, "'x' must be positive"):
+			Guard.against_negative(-1, "x")
+		with self.assertRaisesRegex(ValueError, "'x' must not be zero"):
+			Guard.against_zero(0, "x")
+		with self.assertRaisesRegex(ValueError, "'x' must not be ''"):
+			Guard.against_empty_string("", "x")
+		with self.assertRaisesRegex(ValueError, "'x' must not be empty"):
+			Guard.against_empty_collection({}, "x")
+		with self.assertRaisesRegex(TypeError, "'x' must be of type str. Got int."):
+			Guard.against_wrong_type(1, str, "x")
+
+	def test_against_nonpositive(self):
+		self.assertEqual(guard.against_nonpositive(0.5), 0.5)
+		for value in (0, -1, -0.0):
+			with self.assertRaisesRegex(ValueError, "'x' must be greater than zero"):
+				guard.against_nonpositive(value, "x")
+
+	def test_against_empty_collection_rejects_falsy_values(self):
+		for value in (0, False, None, ""):
+			with self.assertRaises(ValueError):
+				guard.against_empty_collection(value)
+
+	def test_against_not_iterable(self):
+		class NotIterable:
+			__iter__ = None
+
+		class Text(str):
+			pass
+
+		self.assertIsNotNone(guard.against_not_iterable(x for x in ()))
+		for value in ("ab", b"ab", Text("ab"), 3, NotIterable()):
+			with self.assertRaises(TypeError):
+				guard.against_not_iterable(value)
+
+	def test_against_not_iterable_ignores_metaclass_iter(self):
+		class Color(enum.Enum):
+			RED = 1
+
+		class Meta(type):
+			def __iter__(cls):
+				return iter(())
+
+		class Plain(metaclass=Meta):
+			pass
+
+		self.assertIsNotNone(guard.against_not_iterable(Color))
+		for value in (Color.RED, Plain()):
+			with self.assertRaises(TypeError):
+				guard.against_not_iterable(value)
+
+	def test_guard_namespace(self):
+		self.assertIs(Guard.against_none, guard.against_none)
+		with self.assertRaises(TypeError):
+			Guard()
+
+	def test_annotations_resolve_at_runtime(self):
+		hints = typing.get_type_hints(guard.against_negative)
+		self.assertIs(hints["argument"], numbers.Number)
+		self.assertIn("argument", typing.get_type_hints(guard.against_none))
+
+
+class BatchTests(unittest.TestCase):
+
+	def test_passes_and_returns_argument(self):
+		self.assertEqual(guard.batch(5, not_none=True, expected_type=int, not_negative=True, not_zero=True), 5)
+		self.assertIsNone(guard.batch(None))
+
+	def test_raises_like_individual_guards(self):
+		cases = [
+			(None, {"not_none": True}, ValueError, "must not be None"),
+			("a", {"expected_type": int}, TypeError, "must be of type int"),
+			(-1, {"not_negative": True}, ValueError, "must be positive"),
+			(0, {"not_zero": True}, ValueError, "must not be zero"),
+			([], {"not_empty": True}, ValueError, "must not be empty"),
+		]
+		for argument, checks, error, message in cases:
+			with self.subTest(checks=checks):
+				with self.assertRaisesRegex(error, message):
+					guard.batch(argument, "x", **checks)
+
+
+class NoneForTests(unittest.TestCase):
+
+	def test_specialized_guard(self):
+		check = guard.none_for("user_id")
+		self.assertEqual(check(3), 3)
+		with self.assertRaisesRegex(ValueError, "'user_id' must not be None"):
+			check(None)
+
+	def test_guards_are_shared_per_name(self):
+		check = guard.none_for("user_id")
+		self.assertIs(guard.none_for("".join(["user", "_id"])), check)
+		self.assertIsNot(guard.none_for("other"), check)
+
+
+class PathGuardTests(unittest.TestCase):
+
+	def setUp(self):
+		guard.invalidate_path_cache()
+		self.directory = tempfile.TemporaryDirectory()
+		self.addCleanup(self.directory.cleanup)
+		self.addCleanup(guard.invalidate_path_cache)
+		self.file = os.path.join(self.directory.name, "file")
+
+	def touch(self, path):
+		open(path, "w").close()
+
+	def test_accepts_path_like_arguments(self):
+		self.touch(self.file)
+		self.assertEqual(guard.against_file_not_found(self.file.encode()), self.file.encode())
+		self.assertEqual(guard.against_directory_not_found(self.directory.name), self.directory.name)
+
+	def test_invalid_path_arguments(self):
+		with self.assertRaisesRegex(ValueError, "'file_path' must not be None"):
+			guard.against_file_not_found(None)
+		with self.assertRaisesRegex(ValueError, "'directory' must not be None"):
+			guard.against_directory_not_found(None)
+		with self.assertRaisesRegex(TypeError, "valid file path"):
+			guard.against_file_not_found(3)
+		with self.assertRaisesRegex(TypeError, "valid directory path"):
+			guard.against_directory_not_found(3)
+
+	def test_error_types(self):
+		self.touch(self.file)
+		with self.assertRaises(IsADirectoryError):
+			guard.against_file_not_found(self.directory.name)
+		with self.assertRaises(NotADirectoryError):
+			guard.against_directory_not_found(self.file)
+		with self.assertRaises(FileNotFoundError):
+			guard.against_file_not_found(self.file + "-missing")
+		with self.assertRaises(FileNotFoundError):
+			guard.against_directory_not_found(self.file + "-missing")
+
+	def test_misses_are_not_cached(self):
+		with self.assertRaises(FileNotFoundError):
+			guard.against_file_not_found(self.file)
+		self.touch(self.file)
+		self.assertEqual(guard.against_file_not_found(self.file), self.file)
+
+	def test_relative_paths_are_not_cached(self):
+		cwd = os.getcwd()
+		self.addCleanup(os.chdir, cwd)
+		self.touch(self.file)
+		os.chdir(self.directory.name)
+		self.assertEqual(guard.against_file_not_found("file"), "file")
+		os.chdir(cwd)
+		with self.assertRaises(FileNotFoundError):
+			guard.against_file_not_found("file")
+
+	def test_hits_are_cached_until_cleared(self):
+		self.touch(self.file)
+		guard.against_file_not_found(self.file)
+		os.remove(self.file)
+		self.assertEqual(guard.against_file_not_found(self.file), self.file)
+		guard.invalidate_path_cache()
+		with self.assertRaises(FileNotFoundError):
+			guard.against_file_not_found(self.file)
+
+	def test_hits_are_cached_until_invalidated(self):
+		self.touch(self.file)
+		guard.against_file_not_found(self.file)
+		os.remove(self.file)
+		self.assertEqual(guard.against_file_not_found(self.file), self.file)
+		guard.invalidate_path_cache(self.file)
+		with self.assertRaises(FileNotFoundError):
+			guard.against_file_not_found(self.file)
+
+	def test_invalidate_resolves_relative_paths(self):
+		cwd = os.getcwd()
+		self.addCleanup(os.chdir, cwd)
+		self.touch(self.file)
+		guard.against_file_not_found(self.file)
+		os.remove(self.file)
+		os.chdir(self.directory.name)
+		guard.invalidate_path_cache("file")
+		with self.assertRaises(FileNotFoundError):
+			guard.against_file_not_found(self.file)
+
+	def test_invalidate_unnormalized_absolute_paths(self):
+		for path in (self.directory.name + "//file", self.directory.name + "/./file"):
+			with self.subTest(path=path):
+				self.touch(self.file)
+				guard.against_file_not_found(path)
+				os.remove(self.file)
+				guard.invalidate_path_cache(path)
+				with self.assertRaises(FileNotFoundError):
+					guard.against_file_not_found(path)
+
+	def test_hits_expire_after_ttl(self):
+		self.touch(self.file)
+		with mock.patch.object(guard, "_PATH_CACHE_TTL", 0.0):
+			guard.against_file_not_found(self.file)
+			os.remove(self.file)
+			with self.assertRaises(FileNotFoundError):
+				guard.against_file_not_found(self.file)
+
+	def test_cache_is_bounded(self):
+		paths = [os.path.join(self.directory.name, name) for name in "abc"]
+		with mock.patch.object(guard, "_PATH_CACHE_SIZE", 2):
+			for path in paths:
+				self.touch(path)
+				guard.against_file_not_found(path)
+			self.assertEqual(list(guard._PATH_CACHE), paths[1:])
+
+
+class DisabledGuardTests(unittest.TestCase):
+
+	SCRIPT = "\n".join([
+		"import guard",
+		"assert not guard.GUARDS_ENABLED",
+		"assert guard.against_none(None) is None",
+		"assert guard.Guard.against_negative(-1) == -1",
+		"assert guard.against_wrong_type(1, str, 'x') == 1",
+		"assert guard.against_file_not_found(path='missing') == 'missing'",
+		"assert guard.Guard.against_directory_not_found(path='missing', argument_name='d') == 'missing'",
+		"assert guard.batch(None, 'x', not_none=True) is None",
+		"assert guard.none_for('x')(None) is None",
+	])
+
+	def run_disabled(self, *flags, environ=None):
+		env = dict(os.environ, **(environ or {}))
+		subprocess.run(
+			[sys.executable, *flags, "-c", self.SCRIPT],
+			cwd=os.path.dirname(os.path.abspath(guard.__file__)),
+			env=env,
+			check=True,
+		)
+
+	def test_disabled_by_environment(self):
+		self.run_disabled(environ={"PYTHON_GUARDS": "0"})
+
+	def test_disabled_by_optimize_flag(self):
+		self.run_disabled("-O")
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class ArrayGuardTests(unittest.TestCase):
+
+	def test_against_negative_array(self):
+		self.assertEqual(guard.against_negative_array([1, 2]), [1, 2])
+		with self.assertRaisesRegex(ValueError, "'a' must not contain negative values"):
+			guard.against_negative_array(np.array([[1.0, -2.0]]), "a")
+
+	def test_against_negative_array_dtypes(self):
+		dtypes = ["int8", "int64", "uint8", "float16", "float32", ">f8", ">i4", np.longdouble, bool]
+		for dtype in dtypes:
+			with self.subTest(dtype=dtype):
+				self.assertIsNotNone(guard.against_negative_array(np.array([0, 1], dtype=dtype)))
+				if np.dtype(dtype).kind not in "ub":
+					with self.assertRaises(ValueError):
+						guard.against_negative_array(np.array([1, -1], dtype=dtype))
+
+	def test_against_none_array(self):
+		guard.against_none_array(np.arange(3))
+		with self.assertRaises(ValueError):
+			guard.against_none_array(np.array([1.0, np.nan]))
+		with self.assertRaises(ValueError):
+			guard.against_none_array(np.array([1, None], dtype=object))
+
+	def test_against_none_array_missing_values(self):
+		guard.against_none_array(np.array([1, Decimal(2)], dtype=object))
+		guard.against_none_array(np.array(["2020-01-01"], dtype="datetime64[D]"))
+		missing = [
+			np.array([1, np.float32("nan")], dtype=object),
+			np.array([1, Decimal("NaN")], dtype=object),
+			np.array(["2020-01-01", "NaT"], dtype="datetime64[D]"),
+			np.array([1, "NaT"], dtype="timedelta64[s]"),
+		]
+		for array in missing:
+			with self.subTest(array=array):
+				with self.assertRaises(ValueError):
+					guard.against_none_array(array)
+
+	def test_against_zero_array(self):
+		guard.against_zero_array([1, 2])
+		with self.assertRaises(ValueError):
+			guard.against_zero_array(np.arange(3))
+
+
+if __name__ == "__main__":
+	unittest.main()